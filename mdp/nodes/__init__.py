@@ -73,12 +73,21 @@
     from .libsvm_classifier import LibSVMClassifier
     __all__ += ['LibSVMClassifier']
 
+# names of the sklearn wrappers which are only created on first access
+_scikits_lazy = []
 if config.has_sklearn:
     from . import scikits_nodes
-    for name in scikits_nodes.DICT_:
+    from sys import version_info as _version_info
+    _scikits_dict = scikits_nodes.DICT_
+    for name in _scikits_dict:
         if name.endswith('Node'):
-            globals()[name] = scikits_nodes.DICT_[name]
-            __all__.append(name)
+            if _version_info >= (3, 7):
+                # see __getattr__ below
+                _scikits_lazy.append(name)
+            else:
+                # no module __getattr__, create all the wrappers now
+                globals()[name] = _scikits_dict[name]
+                __all__.append(name)
         del name
 
 utils.fixup_namespace(__name__, __all__ + ['ICANode'],
@@ -115,3 +124,19 @@
                        'sfa_nodes_online',
                        'recursive_expansion_nodes',
                        ))
+
+# the lazy sklearn wrappers are exported as well, but are only created
+# when they are accessed (PEP 562); their __module__ is already 'mdp.nodes'
+__all__ += _scikits_lazy
+_scikits_lazy = frozenset(_scikits_lazy)
+
+
+def __getattr__(name):
+    if name in _scikits_lazy:
+        node = globals()[name] = _scikits_dict[name]
+        return node
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _scikits_lazy)
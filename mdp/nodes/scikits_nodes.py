@@ -12,8 +12,16 @@
     import scikits.learn as sklearn
     _sklearn_prefix = 'scikits.learn'
 
+import importlib
 import inspect
+import pkgutil
 import re
+import types
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 import mdp
 
@@ -22,56 +30,15 @@ class ScikitsException(mdp.NodeException):
     pass
 
 # import all submodules of sklearn (to work around lazy import)
-from mdp.configuration import _version_too_old
-if _version_too_old(sklearn.__version__, (0, 8)):
-    scikits_modules = ['ann', 'cluster', 'covariance', 'feature_extraction',
-                       'feature_selection', 'features', 'gaussian_process', 'glm',
-                       'linear_model', 'preprocessing', 'svm',
-                       'pca', 'lda', 'hmm', 'fastica', 'grid_search', 'mixture',
-                       'naive_bayes', 'neighbors', 'qda']
-elif _version_too_old(sklearn.__version__, (0, 9)):
-    # package structure has been changed in 0.8
-    scikits_modules = ['svm', 'linear_model', 'naive_bayes', 'neighbors',
-                       'mixture', 'hmm', 'cluster', 'decomposition', 'lda',
-                       'covariance', 'cross_val', 'grid_search',
-                       'feature_selection.rfe', 'feature_extraction.image',
-                       'feature_extraction.text', 'pipelines', 'pls',
-                       'gaussian_process', 'qda']
-elif _version_too_old(sklearn.__version__, (0, 11)):
-    # from release 0.9 cross_val becomes cross_validation and hmm is deprecated
-    scikits_modules = ['svm', 'linear_model', 'naive_bayes', 'neighbors',
-                       'mixture', 'cluster', 'decomposition', 'lda',
-                       'covariance', 'cross_validation', 'grid_search',
-                       'feature_selection.rfe', 'feature_extraction.image',
-                       'feature_extraction.text', 'pipelines', 'pls',
-                       'gaussian_process', 'qda', 'ensemble', 'manifold',
-                       'metrics', 'preprocessing', 'tree']    
-elif _version_too_old(sklearn.__version__, (0, 17)):
-    scikits_modules = ['svm', 'linear_model', 'naive_bayes', 'neighbors',
-                       'mixture', 'cluster', 'decomposition', 'lda',
-                       'covariance', 'cross_validation', 'grid_search',
-                       'feature_selection', 'feature_extraction',
-                       'pipeline', 'pls', 'gaussian_process', 'qda',
-                       'ensemble', 'manifold', 'metrics', 'preprocessing',
-                       'semi_supervised', 'tree', 'hmm']
-
-else:
-    scikits_modules = ['calibration', 'cluster', 'covariance', 'cross_decomposition',
-                       'cross_validation', 'decomposition', 'discriminant_analysis',
-                       'ensemble', 'feature_extraction', 'feature_selection',
-                       'gaussian_process', 'grid_search', 'isotonic', 'kernel_approximation',
-                       'kernel_ridge', 'learning_curve', 'linear_model', 'manifold',
-                       'metrics', 'mixture', 'multiclass', 'naive_bayes', 'neighbors',
-                       'neural_network', 'preprocessing', 'random_projection',
-                       'semi_supervised', 'svm', 'tree']
-
-
-for name in scikits_modules:
+for _, name, _ in pkgutil.iter_modules(sklearn.__path__):
+    # skip private modules and the test suite
+    if name.startswith('_') or name in ('tests', 'conftest', 'setup'):
+        continue
     # not all modules may be available due to missing dependencies
     # on the user system.
     # we just ignore failing imports
     try:
-        __import__(_sklearn_prefix + '.' + name)
+        importlib.import_module(_sklearn_prefix + '.' + name)
     except ImportError:
         pass
 
@@ -88,15 +55,23 @@ class ScikitsException(mdp.NodeException):
 
 _DOC_TEMPLATE = """
 %s
-This node has been automatically generated by wrapping the ``%s.%s`` class
-from the ``sklearn`` library.  The wrapped instance can be accessed
-through the ``scikits_alg`` attribute.
+%s
 %s
 """
 
-def _gen_docstring(object, docsource=None):
-    module = object.__module__
-    name = object.__name__
+# the docstrings of the wrappers are only generated for interactive use;
+# they are skipped with -O and -OO (where __debug__ is False)
+_WRITE_DOCS = __debug__
+
+_DOC_NOTE = """This node has been automatically generated by wrapping the ``%s.%s`` class
+from the ``sklearn`` library.  The wrapped instance can be accessed
+through the ``scikits_alg`` attribute."""
+
+def _gen_docstring(object, docsource=None, note=None):
+    if note is None:
+        # the note only depends on the wrapped class, so it can be
+        # formatted once and passed in for all the docstrings of a class
+        note = _DOC_NOTE % (object.__module__, object.__name__)
     if docsource is None:
         docsource = object
     docstring = docsource.__doc__
@@ -138,7 +113,7 @@ def _gen_docstring(object, docsource=None):
                     next = therest[i+1][prefix:]
                     quoteind = len(_WS_PREFIX_RE.match(next).group(1))
 
-    return _DOC_TEMPLATE % ('\n'.join(header), module, name, '\n'.join(body))
+    return _DOC_TEMPLATE % ('\n'.join(header), note, '\n'.join(body))
 
 # TODO: generalize dtype support
 # TODO: have a look at predict_proba for Classifier.prob
@@ -156,50 +131,319 @@ def apply_to_scikits_algorithms(current_module, action,
                                 processed_modules=None,
                                 processed_classes=None):
     """Function that traverses a module to find scikits algorithms.
-    'sklearn' algorithms are identified by the 'fit' 'predict',
-    or 'transform' methods. The 'action' function is applied to each found
-    algorithm.
+    'sklearn' algorithms are classes defined in 'sklearn' and are identified
+    by the 'fit' 'predict', or 'transform' methods. The 'action' function is
+    applied to each found algorithm.
     
     :param action: A function that is called with as action(class_), where
         'class_' is a class that defines the 'fit' or 'predict' method.
     :type action: function
+
+    :param processed_modules: The ``id`` of the modules already visited.
+    :type processed_modules: set
+
+    :param processed_classes: The ``id`` of the classes already visited.
+    :type processed_classes: set
     """
 
     # only consider modules and classes once
     if processed_modules is None:
-        processed_modules = []
+        processed_modules = set()
     if processed_classes is None:
-        processed_classes = []
+        processed_classes = set()
 
-    if current_module in processed_modules:
-        return
-    processed_modules.append(current_module)
+    if id(current_module) in processed_modules:
+        return processed_classes
+    processed_modules.add(id(current_module))
 
-    for member_name, member in list(current_module.__dict__.items()):
-        if not member_name.startswith('_'):
+    module_type = types.ModuleType
+
+    # depth-first traversal with an explicit stack of member iterators,
+    # so that the members are visited in the same order as by recursion
+    stack = [iter(current_module.__dict__.items())]
+    while stack:
+        for member_name, member in stack[-1]:
+            if member_name[:1] == '_':
+                continue
 
             # classes
-            if (inspect.isclass(member) and
-                member not in processed_classes):
-                processed_classes.append(member)
+            if isinstance(member, type) and id(member) not in processed_classes:
+                processed_classes.add(id(member))
+                # skip the classes sklearn imports from other libraries
+                # (e.g., numpy or scipy) before probing their attributes
+                module_name = getattr(member, '__module__', None) or ''
+                if not module_name.startswith(_sklearn_prefix):
+                    continue
+                # hasattr on a class is served by the type attribute cache,
+                # which is faster than scanning the __dict__ of each class
+                # in the __mro__ from Python
                 if (hasattr(member, 'fit')
                     or hasattr(member, 'predict')
                     or hasattr(member, 'transform')):
                     action(member)
 
             # other modules
-            elif (inspect.ismodule(member) and
-                  member.__name__.startswith(_sklearn_prefix)):
-                apply_to_scikits_algorithms(member, action, processed_modules,
-                                            processed_classes)
+            elif (isinstance(member, module_type) and
+                  member.__name__.startswith(_sklearn_prefix) and
+                  id(member) not in processed_modules):
+                processed_modules.add(id(member))
+                stack.append(iter(member.__dict__.items()))
+                break
+        else:
+            # all members of the current module have been visited
+            stack.pop()
     return processed_classes
 
 
+# NOTE: at this point scikits nodes can only support up to
+# 64-bits floats because some call numpy.linalg.svd, which for
+# some reason does not support higher precisions
+_SUPPORTED_DTYPES = ('float32', 'float64')
+
 _OUTPUTDIM_ERROR = """'output_dim' keyword not supported.
 Please set the output dimensionality using sklearn keyword
 arguments (e.g., 'n_components', or 'k'). See the docstring of this
 class for details."""
 
+# (MDP method name, sklearn method name) pairs of the wrapped methods;
+# the last pair is the one used for execution
+_CLASSIFIER_METHODS = (('__init__', '__init__'),
+                       ('stop_training', 'fit'),
+                       ('label', 'predict'))
+_TRANSFORMER_METHODS = (('__init__', '__init__'),
+                        ('stop_training', 'fit'),
+                        ('execute', 'transform'))
+_PREDICTOR_METHODS = (('__init__', '__init__'),
+                      ('stop_training', 'fit'),
+                      ('execute', 'predict'))
+
+def _get_func(method):
+    """Return the function wrapped by a method.
+
+    Bound methods and unbound methods (Python 2) hold the function in
+    ``__func__`` (``im_func`` is only an alias of it); anything else is
+    returned unchanged.
+    """
+    return getattr(method, '__func__', method)
+
+def _copy_docstrings(cls, scikits_class, methods, note, default_doc):
+    """Set the docstrings of the methods of a wrapper class from the ones
+    of the corresponding sklearn methods.
+
+    :param methods: (MDP method name, sklearn method name) pairs.
+    :type methods: tuple
+
+    :param default_doc: Docstring used for the methods for which sklearn
+        does not provide one.
+    :type default_doc: str
+    """
+    for mdp_name, scikits_name in methods:
+        # the functions are defined on the class itself (the public
+        # methods by the metaclass), so read them from the class dict
+        # and avoid creating unbound methods in Python 2
+        mdp_method = cls.__dict__.get(mdp_name)
+        if not isinstance(mdp_method, types.FunctionType):
+            continue
+        scikits_method = _get_func(getattr(scikits_class, scikits_name,
+                                           None))
+        if inspect.isfunction(scikits_method):
+            mdp_method.__doc__ = (_gen_docstring(scikits_class,
+                                                 scikits_method, note)
+                                  or default_doc)
+
+
+class _ScikitsNodeMixin(object):
+    """Methods shared by the MDP nodes wrapping sklearn algorithms.
+
+    The wrapper classes created by ``_make_wrapper`` only define the
+    class attributes below, so that all of them share the same methods.
+    """
+
+    # the wrapped sklearn class
+    scikits_class = None
+    # True if the sklearn class defines 'fit'
+    _trainable = False
+    # name of the sklearn method used for execution
+    _scikits_exec_name = None
+
+    def __init__(self, input_dim=None, output_dim=None, dtype=None,
+                 **kwargs):
+        """
+        Initializes an object of type 'ScikitsNode'.
+
+        :param input_dim: Dimensionality of the input.
+            Default is None.
+        :type input_dim: int
+
+        :param output_dim: Dimensionality of the output.
+            Default is None.
+        :type output_dim: int
+
+        :param dtype: Datatype of the input.
+            Default is None.
+        :type dtype: numpy.dtype or str
+        """
+        if output_dim is not None:
+            # output_dim only makes sense for nodes that preserve the
+            # dimensionality
+            if not isinstance(self, mdp.PreserveDimNode):
+                raise ScikitsException(_OUTPUTDIM_ERROR)
+            # output_dim and n_components cannot be defined at the same time
+            if 'n_components' in kwargs:
+                msg = ("Dimensionality set both by "
+                       "output_dim=%d and n_components=%d""")
+                raise ScikitsException(msg % (output_dim,
+                                              kwargs['n_components']))
+
+        super(_ScikitsNodeMixin, self).__init__(input_dim=input_dim,
+                                                output_dim=output_dim,
+                                                dtype=dtype)
+        self.scikits_alg = self.scikits_class(**kwargs)
+
+    # ---- administrative details
+
+    @staticmethod
+    def is_invertible():
+        return False
+
+    @classmethod
+    def is_trainable(cls):
+        """Return True if the node can be trained, False otherwise.
+
+        :return: A boolean indicating whether the node can be trained.
+        :rtype: bool
+        """
+        return cls._trainable
+
+    def _get_supported_dtypes(self):
+        """Return the dtypes supported by this node.
+        The types can be specified in any format allowed by numpy.dtype.
+
+        :return: The dtypes supported by this node.
+        :rtype: tuple
+        """
+        return _SUPPORTED_DTYPES
+
+
+class _ScikitsClassifierNode(_ScikitsNodeMixin, mdp.ClassifierCumulator):
+    """Base class of the nodes wrapping sklearn classifiers."""
+
+    # ---- re-direct training and execution to the wrapped algorithm
+    # (defined here rather than in the mixin, so that the metaclass
+    # gives stop_training the signature of _stop_training)
+
+    def _stop_training(self, **kwargs):
+        super(_ScikitsClassifierNode, self)._stop_training()
+        return self.scikits_alg.fit(self.data, self.labels, **kwargs)
+
+    def _label(self, x):
+        y = getattr(self.scikits_alg, self._scikits_exec_name)(x)
+        if y.ndim == 0:
+            return mdp.numx.atleast_2d(y).T
+        # labels are returned as a column vector (reshape gives a view)
+        return y.reshape(y.shape[0], 1)
+
+
+class _ScikitsExecuteNode(_ScikitsNodeMixin, mdp.Cumulator):
+    """Base class of the nodes wrapping sklearn transformers and
+    predictors."""
+
+    # ---- re-direct training and execution to the wrapped algorithm
+
+    def _stop_training(self, **kwargs):
+        super(_ScikitsExecuteNode, self)._stop_training()
+        return self.scikits_alg.fit(self.data, **kwargs)
+
+    def _execute(self, x):
+        return getattr(self.scikits_alg, self._scikits_exec_name)(x)
+
+
+def _copy_function(func):
+    """Return a copy of a function sharing the same code, so that its
+    docstring can be changed independently."""
+    func = _get_func(func)
+    copy = types.FunctionType(func.__code__, func.__globals__,
+                              func.__name__, func.__defaults__,
+                              func.__closure__)
+    copy.__dict__.update(func.__dict__)
+    copy.__doc__ = func.__doc__
+    return copy
+
+
+# the package exporting the wrappers
+_NODES_MODULE = 'mdp.nodes'
+
+# wrapper classes already created, indexed by (sklearn class, methods)
+_WRAPPERS = {}
+
+def _make_wrapper(scikits_class, base_cls, methods):
+    """Create an MDP Node subclass of ``base_cls`` wrapping a sklearn class.
+    Wrapping the same class again returns the existing wrapper.
+
+    :param scikits_class: The sklearn class to be wrapped.
+    :type scikits_class: type
+
+    :param base_cls: The MDP class the wrapper derives from
+        (``_ScikitsClassifierNode`` or ``_ScikitsExecuteNode``).
+    :type base_cls: type
+
+    :param methods: ``(mdp_name, scikits_name)`` pairs of the methods
+        redirected to sklearn (see ``_CLASSIFIER_METHODS``). The last
+        pair maps the MDP execution method ('execute' or 'label').
+    :type methods: tuple
+
+    :return: The wrapper class.
+    :rtype: type
+    """
+    key = (scikits_class, methods)
+    if key in _WRAPPERS:
+        return _WRAPPERS[key]
+
+    name = scikits_class.__name__ + 'ScikitsLearnNode'
+    # the wrappers of the sklearn algorithms found at import are exported
+    # by mdp.nodes (see DICT_), set their final module here so that they
+    # can be pickled however they were obtained; wrapping the same class
+    # with other methods gives a different, non-exported class
+    candidate = _CANDIDATES.get(name)
+    if (candidate is not None and candidate[0] is scikits_class and
+            _FACTORY_METHODS[candidate[1]] == methods):
+        module = _NODES_MODULE
+    else:
+        module = __name__
+
+    # the methods are shared by all wrappers, only the class attributes
+    # depend on the wrapped class
+    members = {'__module__': module,
+               '__qualname__': name,
+               'scikits_class': scikits_class,
+               '_trainable': hasattr(scikits_class, 'fit'),
+               '_scikits_exec_name': methods[-1][1]}
+    if _WRITE_DOCS:
+        note = _DOC_NOTE % (scikits_class.__module__, scikits_class.__name__)
+        class_doc = _gen_docstring(scikits_class, note=note)
+        members['__doc__'] = class_doc
+        # the wrapper needs its own copy of the methods to get the
+        # docstrings of the corresponding sklearn methods
+        for mdp_name, _ in methods:
+            members[mdp_name] = _copy_function(getattr(base_cls, mdp_name))
+    else:
+        members['__doc__'] = None
+
+    # use the metaclass of the base class, as for any other node
+    ScikitsNode = type(base_cls)(name, (base_cls,), members)
+    # the methods defined on the wrapper itself (the copies above and the
+    # public methods added by the metaclass) belong to the same module
+    for member in vars(ScikitsNode).values():
+        if isinstance(member, types.FunctionType):
+            member.__module__ = module
+
+    if _WRITE_DOCS:
+        # change the docstring of the methods to match the ones in sklearn
+        _copy_docstrings(ScikitsNode, scikits_class, methods, note, class_doc)
+    _WRAPPERS[key] = ScikitsNode
+    return ScikitsNode
+
+
 def wrap_scikits_classifier(scikits_class):
     """Wrap a sklearn classifier as an MDP Node subclass.
     The wrapper maps these MDP methods to their sklearn equivalents:
@@ -208,107 +452,8 @@ def wrap_scikits_classifier(scikits_class):
     - _label -> predict
 
     """
-
-    newaxis = mdp.numx.newaxis
-
-    # create a wrapper class for a sklearn classifier
-    class ScikitsNode(mdp.ClassifierCumulator):
-
-        def __init__(self, input_dim=None, output_dim=None, dtype=None,
-                     **kwargs):
-            """
-            Initializes an object of type 'ScikitsNode'.
-
-            :param input_dim: Dimensionality of the input.
-                Default is None.
-            :type input_dim: int
-        
-            :param output_dim: Dimensionality of the output.
-                Default is None.
-            :type output_dim: int
-        
-            :param dtype: Datatype of the input.
-                Default is None.
-            :type dtype: numpy.dtype or str
-            """
-            if output_dim is not None:
-                # output_dim and n_components cannot be defined at the same time
-                if 'n_components' in kwargs:
-                    msg = ("Dimensionality set both by "
-                           "output_dim=%d and n_components=%d""")
-                    raise ScikitsException(msg % (output_dim,
-                                                  kwargs['n_components']))
-
-
-            super(ScikitsNode, self).__init__(input_dim=input_dim,
-                                              output_dim=output_dim,
-                                              dtype=dtype)
-            self.scikits_alg = scikits_class(**kwargs)
-
-        # ---- re-direct training and execution to the wrapped algorithm
-
-        def _stop_training(self, **kwargs):
-            super(ScikitsNode, self)._stop_training(self)
-            return self.scikits_alg.fit(self.data, self.labels, **kwargs)
-
-        def _label(self, x):
-            return self.scikits_alg.predict(x)[:, newaxis]
-
-        # ---- administrative details
-
-        @staticmethod
-        def is_invertible():
-            return False
-
-        @staticmethod
-        def is_trainable():
-            """Return True if the node can be trained, False otherwise.
-
-            :return: A boolean indicating whether the node can be trained.
-            :rtype: bool
-            """
-            return hasattr(scikits_class, 'fit')
-
-        # NOTE: at this point scikits nodes can only support up to
-        # 64-bits floats because some call numpy.linalg.svd, which for
-        # some reason does not support higher precisions
-        def _get_supported_dtypes(self):
-            """Return the list of dtypes supported by this node.
-            The types can be specified in any format allowed by numpy.dtype.
-
-            :return: The list of dtypes supported by this node.
-            :rtype: list
-            """
-            return ['float32', 'float64']
-
-    # modify class name and docstring
-    ScikitsNode.__name__ = scikits_class.__name__ + 'ScikitsLearnNode'
-    ScikitsNode.__doc__ = _gen_docstring(scikits_class)
-
-    # change the docstring of the methods to match the ones in sklearn
-
-    # methods_dict maps ScikitsNode method names to sklearn method names
-    methods_dict = {'__init__': '__init__',
-                    'stop_training': 'fit',
-                    'label': 'predict'}
-    if hasattr(scikits_class, 'predict_proba'):
-        methods_dict['prob'] = 'predict_proba'
-
-    for mdp_name, scikits_name in list(methods_dict.items()):
-        mdp_method = getattr(ScikitsNode, mdp_name)
-        scikits_method = getattr(scikits_class, scikits_name)
-        if hasattr(scikits_method, '__func__'):
-            mdp_method.__func__.__doc__ = _gen_docstring(scikits_class,
-                                                        scikits_method.__func__)
-
-    if scikits_class.__init__.__doc__ is None:
-        try:
-            ScikitsNode.__init__.__func__.__doc__ = _gen_docstring(scikits_class)
-        except AttributeError:
-            # we are in Python3
-            ScikitsNode.__init__.__doc__ = _gen_docstring(scikits_class)
-
-    return ScikitsNode
+    return _make_wrapper(scikits_class, _ScikitsClassifierNode,
+                         _CLASSIFIER_METHODS)
 
 
 def wrap_scikits_transformer(scikits_class):
@@ -319,95 +464,8 @@ def wrap_scikits_transformer(scikits_class):
     - _execute -> transform
 
     """
-
-    # create a wrapper class for a sklearn transformer
-    class ScikitsNode(mdp.Cumulator):
-
-        def __init__(self, input_dim=None, output_dim=None, dtype=None, **kwargs):
-            """
-            Initializes an object of type 'ScikitsNode'.
-
-            :param input_dim: Dimensionality of the input.
-                Default is None.
-            :type input_dim: int
-        
-            :param output_dim: Dimensionality of the output.
-                Default is None.
-            :type output_dim: int
-        
-            :param dtype: Datatype of the input.
-                Default is None.
-            :type dtype: numpy.dtype or str
-            """
-            if output_dim is not None:
-                raise ScikitsException(_OUTPUTDIM_ERROR)
-            super(ScikitsNode, self).__init__(input_dim=input_dim,
-                                              output_dim=output_dim,
-                                              dtype=dtype)
-            self.scikits_alg = scikits_class(**kwargs)
-
-        # ---- re-direct training and execution to the wrapped algorithm
-
-        def _stop_training(self, **kwargs):
-            super(ScikitsNode, self)._stop_training(self)
-            return self.scikits_alg.fit(self.data, **kwargs)
-
-        def _execute(self, x):
-            return self.scikits_alg.transform(x)
-
-        # ---- administrative details
-
-        @staticmethod
-        def is_invertible():
-            return False
-
-        @staticmethod
-        def is_trainable():
-            """Return True if the node can be trained, False otherwise.
-
-            :return: A boolean indication whether the node can be trained.
-            :rtype: bool
-            """
-            return hasattr(scikits_class, 'fit')
-
-        # NOTE: at this point scikits nodes can only support up to
-        # 64-bits floats because some call numpy.linalg.svd, which for
-        # some reason does not support higher precisions
-        def _get_supported_dtypes(self):
-            """Return the list of dtypes supported by this node.
-            The types can be specified in any format allowed by numpy.dtype.
-
-            :return: The list of dtypes supported by this node.
-            :rtype: list
-            """
-            return ['float32', 'float64']
-
-    # modify class name and docstring
-    ScikitsNode.__name__ = scikits_class.__name__ + 'ScikitsLearnNode'
-    ScikitsNode.__doc__ = _gen_docstring(scikits_class)
-
-    # change the docstring of the methods to match the ones in sklearn
-
-    # methods_dict maps ScikitsNode method names to sklearn method names
-    methods_dict = {'__init__': '__init__',
-                    'stop_training': 'fit',
-                    'execute': 'transform'}
-
-    for mdp_name, scikits_name in list(methods_dict.items()):
-        mdp_method = getattr(ScikitsNode, mdp_name)
-        scikits_method = getattr(scikits_class, scikits_name, None)
-        if hasattr(scikits_method, '__func__'):
-            mdp_method.__func__.__doc__ = _gen_docstring(scikits_class,
-                                                        scikits_method.__func__)
-
-    if scikits_class.__init__.__doc__ is None:
-        try:
-            ScikitsNode.__init__.__func__.__doc__ = _gen_docstring(scikits_class)
-        except AttributeError:
-            # we are in Python3
-            ScikitsNode.__init__.__doc__ = _gen_docstring(scikits_class)
-
-    return ScikitsNode
+    return _make_wrapper(scikits_class, _ScikitsExecuteNode,
+                         _TRANSFORMER_METHODS)
 
 
 def wrap_scikits_predictor(scikits_class):
@@ -418,90 +476,14 @@ def wrap_scikits_predictor(scikits_class):
     - _execute -> predict
     
     """
+    return _make_wrapper(scikits_class, _ScikitsExecuteNode,
+                         _PREDICTOR_METHODS)
 
-    # create a wrapper class for a sklearn predictor
-    class ScikitsNode(mdp.Cumulator):
-
-        def __init__(self, input_dim=None, output_dim=None, dtype=None, **kwargs):
-            """
-            Initializes an object of type 'ScikitsNode'.
-
-            :param input_dim: Dimensionality of the input.
-                Default is None.
-            :type input_dim: int
-        
-            :param output_dim: Dimensionality of the output.
-                Default is None.
-            :type output_dim: int
-        
-            :param dtype: Datatype of the input.
-                Default is None.
-            :type dtype: numpy.dtype or str
-            """
-            if output_dim is not None:
-                raise ScikitsException(_OUTPUTDIM_ERROR)
-            super(ScikitsNode, self).__init__(input_dim=input_dim,
-                                              output_dim=output_dim,
-                                              dtype=dtype)
-            self.scikits_alg = scikits_class(**kwargs)
-
-        # ---- re-direct training and execution to the wrapped algorithm
-
-        def _stop_training(self, **kwargs):
-            super(ScikitsNode, self)._stop_training(self)
-            return self.scikits_alg.fit(self.data, **kwargs)
-
-        def _execute(self, x):
-            return self.scikits_alg.predict(x)
-
-        # ---- administrative details
-
-        @staticmethod
-        def is_invertible():
-            return False
-
-        @staticmethod
-        def is_trainable():
-            """Return True if the node can be trained, False otherwise.
-
-            :return: A boolean indicating whether the node can be trained.
-            :rtype: bool"""
-            return hasattr(scikits_class, 'fit')
-
-        # NOTE: at this point scikits nodes can only support up to 64-bits floats
-        # because some call numpy.linalg.svd, which for some reason does not
-        # support higher precisions
-        def _get_supported_dtypes(self):
-            """Return the list of dtypes supported by this node.
-            The types can be specified in any format allowed by numpy.dtype."""
-            return ['float32', 'float64']
-
-    # modify class name and docstring
-    ScikitsNode.__name__ = scikits_class.__name__ + 'ScikitsLearnNode'
-    ScikitsNode.__doc__ = _gen_docstring(scikits_class)
-
-    # change the docstring of the methods to match the ones in sklearn
-
-    # methods_dict maps ScikitsNode method names to sklearn method names
-    methods_dict = {'__init__': '__init__',
-                    'stop_training': 'fit',
-                    'execute': 'predict'}
-
-    for mdp_name, scikits_name in list(methods_dict.items()):
-        mdp_method = getattr(ScikitsNode, mdp_name)
-        scikits_method = getattr(scikits_class, scikits_name)
-        if hasattr(scikits_method, '__func__'):
-            mdp_method.__func__.__doc__ = _gen_docstring(scikits_class,
-                                                        scikits_method.__func__)
-
-    if scikits_class.__init__.__doc__ is None:
-        try:
-            ScikitsNode.__init__.__func__.__doc__ = _gen_docstring(scikits_class)
-        except AttributeError:
-            # we are in Python3
-            ScikitsNode.__init__.__doc__ = _gen_docstring(scikits_class)
 
-    return ScikitsNode
+# the methods redirected by the wrappers created by each factory
+_FACTORY_METHODS = {wrap_scikits_classifier: _CLASSIFIER_METHODS,
+                    wrap_scikits_transformer: _TRANSFORMER_METHODS,
+                    wrap_scikits_predictor: _PREDICTOR_METHODS}
 
 
 #list candidate nodes
@@ -512,38 +494,107 @@ def print_public_members(class_):
     print('%s (%s)' % (class_.__name__, class_.__module__))
     for attr_name in dir(class_):
         attr = getattr(class_, attr_name)
-        #print attr_name, type(attr)
-        if not attr_name.startswith('_') and inspect.ismethod(attr):
+        #print(attr_name, type(attr))
+        if (not attr_name.startswith('_') and
+            isinstance(attr, (types.FunctionType, types.MethodType))):
             print(' -', attr_name)
 
 #apply_to_scikits_algorithms(sklearn, print_public_members)
 
 
-def wrap_scikits_algorithms(scikits_class, nodes_list):
-    """NEED DOCSTRING."""
+_ClassifierMixin = sklearn.base.ClassifierMixin
+
+def _get_wrapper_factory(scikits_class):
+    """Return the function wrapping ``scikits_class`` as an MDP Node,
+    or None if the class should not be wrapped."""
 
     name = scikits_class.__name__
     if (name[:4] == 'Base' or name == 'LinearModel'
         or name.startswith('EllipticEnvelop')
         or name.startswith('ForestClassifier')):
-        return
+        return None
 
-    if issubclass(scikits_class, sklearn.base.ClassifierMixin) and \
-        hasattr(scikits_class, 'fit'):
-        nodes_list.append(wrap_scikits_classifier(scikits_class))
     # Some (abstract) transformers do not implement fit.
-    elif hasattr(scikits_class, 'transform') and hasattr(scikits_class, 'fit'):
-        nodes_list.append(wrap_scikits_transformer(scikits_class))
-    elif hasattr(scikits_class, 'predict') and hasattr(scikits_class, 'fit'):
-        nodes_list.append(wrap_scikits_predictor(scikits_class))
+    if not hasattr(scikits_class, 'fit'):
+        return None
+    # not all predictors and transformers derive from the sklearn
+    # mixins (e.g., GaussianMixture), so only classifiers are
+    # identified by their base class
+    if issubclass(scikits_class, _ClassifierMixin):
+        return wrap_scikits_classifier
+    elif hasattr(scikits_class, 'transform'):
+        return wrap_scikits_transformer
+    elif hasattr(scikits_class, 'predict'):
+        return wrap_scikits_predictor
+    return None
+
+
+def wrap_scikits_algorithms(scikits_class, nodes_list=None):
+    """Wrap a sklearn class as an MDP Node subclass.
+
+    :param scikits_class: The sklearn class to be wrapped.
+    :type scikits_class: type
+
+    :param nodes_list: If given, the wrapper is appended to it.
+    :type nodes_list: list
+
+    :return: The wrapper class, or None if the class cannot be wrapped.
+    :rtype: type
+    """
+    factory = _get_wrapper_factory(scikits_class)
+    if factory is None:
+        return None
+    wrapped = factory(scikits_class)
+    if nodes_list is not None:
+        nodes_list.append(wrapped)
+    return wrapped
+
+
+_scikits_classes = []
+apply_to_scikits_algorithms(sklearn, _scikits_classes.append)
+_factories = ((scikits_class, _get_wrapper_factory(scikits_class))
+              for scikits_class in _scikits_classes)
+# maps the names of the wrapper classes to the wrapped sklearn class and
+# the function creating the wrapper
+_CANDIDATES = {scikits_class.__name__ + 'ScikitsLearnNode':
+               (scikits_class, factory)
+               for scikits_class, factory in _factories
+               if factory is not None}
+del _scikits_classes, _factories
+
+
+class _LazyDict(Mapping):
+    """Read-only mapping of the scikits nodes, indexed by their name.
+
+    The wrapper classes are only created on first access, since most of
+    them are usually never used. Iterating over the names, ``len`` and
+    membership tests do not create any wrapper; ``values``, ``items``
+    and comparisons create all of them.
+    """
+
+    def __init__(self):
+        # the wrappers created so far, indexed by their name
+        self._created = {}
+
+    def __getitem__(self, name):
+        wrapped = self._created.get(name)
+        if wrapped is None:
+            scikits_class, factory = _CANDIDATES[name]
+            wrapped = self._created[name] = factory(scikits_class)
+        return wrapped
+
+    def __iter__(self):
+        return iter(_CANDIDATES)
+
+    def __len__(self):
+        return len(_CANDIDATES)
+
+    def __contains__(self, name):
+        return name in _CANDIDATES
 
-scikits_nodes = []
-apply_to_scikits_algorithms(sklearn,
-                            lambda c: wrap_scikits_algorithms(c, scikits_nodes))
+    def __repr__(self):
+        return '<%s of %d scikits nodes (%d created)>' % (
+            self.__class__.__name__, len(self), len(self._created))
 
 # add scikit nodes to dictionary
-#scikits_module = new.module('scikits')
-DICT_ = {}
-for wrapped_c in scikits_nodes:
-    #print wrapped_c.__name__
-    DICT_[wrapped_c.__name__] = wrapped_c
\ No newline at end of file
+DICT_ = _LazyDict()
\ No newline at end of file
@@ -456,7 +456,9 @@ def CCIPCANode_inp_arg_gen():
                  'OneVsOneClassifierScikitsLearnNode',
                  'OneVsRestClassifierScikitsLearnNode',
                  'VotingClassifierScikitsLearnNode',
-                 'StackingClassifierScikitsLearnNode')
+                 'StackingClassifierScikitsLearnNode',
+                 'ClassifierChainScikitsLearnNode',
+                 'MultiOutputClassifierScikitsLearnNode')
 
 # The following Nodes require their input to be made positive.
 # We do this using inp = numx.absolute(inp) for these nodes.
@@ -494,8 +496,10 @@ def generate_nodes_list(nodes_dicts):
     # they do not have a common API that would allow
     # automatic testing
     # XXX
-    for node_name in mdp.nodes.__dict__:
-        node = mdp.nodes.__dict__[node_name]
+    # the sklearn wrappers are created on first access, so they are
+    # not necessarily in mdp.nodes.__dict__ yet
+    for node_name in dir(mdp.nodes):
+        node = getattr(mdp.nodes, node_name)
         if (inspect.isclass(node)
             and node_name.endswith('ScikitsLearnNode')
             and (node not in visited)
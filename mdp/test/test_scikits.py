@@ -1,11 +1,17 @@
 from __future__ import division
 from past.utils import old_div
+import subprocess
+import sys
 from ._tools import *
 
 requires_scikits = skip_on_condition(
     "not mdp.config.has_sklearn or mdp.numx_description != 'scipy'",
     "This test requires sklearn and SciPy")
 
+requires_sklearn = skip_on_condition(
+    "not mdp.config.has_sklearn",
+    "This test requires sklearn")
+
 requires_pcasikitslearnnode = skip_on_condition(
     "'PCAScikitsLearnNode' not in dir(mdp.nodes)",
     "This test requires sklearn.decomposition.pca.PCA to be available")
@@ -36,3 +42,86 @@ def test_scikits_PCANode_training():
     assert_array_almost_equal(old_div(y[:,0],100.), old_div(x[:,3],100.), 1)
     assert_array_almost_equal(old_div(y[:,1],10.), old_div(x[:,1],10.), 1)
 
+
+# run in a new interpreter, where no scikits node has been created yet
+_LAZY_NODES_SCRIPT = """
+import pickle, sys
+import mdp
+scikits_nodes = sys.modules['mdp.nodes.scikits_nodes']
+names = ['PCAScikitsLearnNode', 'FastICAScikitsLearnNode']
+for name in names:
+    assert name in dir(mdp.nodes)
+    assert name in mdp.nodes.__all__
+    assert name in scikits_nodes.DICT_
+    assert name not in vars(mdp.nodes)
+    assert name not in scikits_nodes.DICT_._created
+# created through the module
+node = mdp.nodes.PCAScikitsLearnNode
+assert 'PCAScikitsLearnNode' in vars(mdp.nodes)
+assert scikits_nodes.DICT_['PCAScikitsLearnNode'] is node
+assert node.__module__ == 'mdp.nodes'
+# created through DICT_
+node = scikits_nodes.DICT_['FastICAScikitsLearnNode']
+assert 'FastICAScikitsLearnNode' not in vars(mdp.nodes)
+assert node.__module__ == 'mdp.nodes'
+pickle.loads(pickle.dumps(node()))
+assert mdp.nodes.FastICAScikitsLearnNode is node
+"""
+
+@requires_sklearn
+@skip_on_condition("sys.version_info < (3, 7)",
+                   "Lazy module attributes require Python 3.7")
+def test_scikits_nodes_created_on_access():
+    """Check that the scikits nodes are listed before they are created."""
+    subprocess.check_call([sys.executable, '-c', _LAZY_NODES_SCRIPT])
+
+
+@requires_sklearn
+def test_scikits_wrappers_are_reused():
+    """Check that wrapping a sklearn class twice gives the same node."""
+    scikits_nodes = sys.modules['mdp.nodes.scikits_nodes']
+    name = next(iter(scikits_nodes.DICT_))
+    scikits_class, factory = scikits_nodes._CANDIDATES[name]
+    node = scikits_nodes.DICT_[name]
+    assert factory(scikits_class) is node
+    nodes_list = []
+    wrapped = scikits_nodes.wrap_scikits_algorithms(scikits_class,
+                                                    nodes_list)
+    assert wrapped is node
+    assert nodes_list == [node]
+
+
+@requires_sklearn
+@requires_pcasikitslearnnode
+def test_scikits_other_wrappers_not_exported():
+    """Check that wrapping a class with other methods does not claim the
+    name of the exported node."""
+    scikits_nodes = sys.modules['mdp.nodes.scikits_nodes']
+    exported = mdp.nodes.PCAScikitsLearnNode
+    node = scikits_nodes.wrap_scikits_predictor(exported.scikits_class)
+    assert node is not exported
+    assert node.__module__ == 'mdp.nodes.scikits_nodes'
+    assert exported.__module__ == 'mdp.nodes'
+
+
+@requires_sklearn
+def test_scikits_node_init_arguments():
+    """Check that the arguments of the sklearn class are passed through."""
+    node = mdp.nodes.PCAScikitsLearnNode(n_components=2, whiten=True)
+    assert node.scikits_alg.n_components == 2
+    assert node.scikits_alg.whiten
+    assert node.input_dim is None
+    # unknown arguments are rejected when the node is created
+    pytest.raises(TypeError, mdp.nodes.PCAScikitsLearnNode,
+                  no_such_argument=1)
+
+
+@requires_sklearn
+@requires_pcasikitslearnnode
+def test_scikits_node_stop_training_arguments():
+    """Check that stop_training only accepts keyword arguments."""
+    node = mdp.nodes.PCAScikitsLearnNode()
+    node.train(mdp.numx_rand.random((20, 3)))
+    pytest.raises(TypeError, node.stop_training, 1)
+    node.stop_training()
+    assert node.execute(mdp.numx_rand.random((5, 3))).shape == (5, 3)